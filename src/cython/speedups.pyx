@@ -11,25 +11,17 @@
 
 from logbook.concurrency import (
     ContextVar,
-    GreenletRLock,
     context_get_ident,
+    context_ident,
     greenlet_get_ident,
     greenlet_local,
-    is_context_enabled,
     is_gevent_enabled,
     thread_get_ident,
     thread_local,
 )
 
-from cpython.dict cimport PyDict_Clear, PyDict_SetItem
-from cpython.list cimport PyList_Append, PyList_GET_SIZE, PyList_Sort
-from cpython.pythread cimport (
-    WAIT_LOCK,
-    PyThread_acquire_lock,
-    PyThread_allocate_lock,
-    PyThread_release_lock,
-    PyThread_type_lock,
-)
+from cpython.dict cimport PyDict_Clear, PyDict_SetItem, PyDict_Size
+from cpython.list cimport PyList_Append, PyList_Sort
 
 _missing = object()
 
@@ -67,26 +59,28 @@ cdef class group_reflected_property:
 
 
 cdef class _StackItem:
-    cdef int id
+    cdef unsigned long long id
     cdef readonly object val
 
-    def __init__(self, int id, object val):
+    def __init__(self, unsigned long long id, object val):
         self.id = id
         self.val = val
+
     def __richcmp__(_StackItem self, _StackItem other, int op):
-        cdef int diff = other.id - self.id # preserving older code
+        # items sort in reverse push order so the latest pushed comes first.
+        # Compare the ids directly, their difference could overflow.
         if op == 0: # <
-            return diff < 0
+            return self.id > other.id
         if op == 1: # <=
-            return diff <= 0
+            return self.id >= other.id
         if op == 2: # ==
-            return diff == 0
+            return self.id == other.id
         if op == 3: # !=
-            return diff != 0
+            return self.id != other.id
         if op == 4: # >
-            return diff > 0
+            return self.id < other.id
         if op == 5: # >=
-            return diff >= 0
+            return self.id <= other.id
         assert False, "should never get here"
 
 cdef class _StackBound:
@@ -183,79 +177,85 @@ cdef class StackedObject:
 
 cdef class ContextStackManager:
     cdef list _global
-    cdef PyThread_type_lock _thread_context_lock
     cdef object _thread_context
-    cdef object _greenlet_context_lock
     cdef object _greenlet_context
     cdef object _context_stack
     cdef dict _cache
-    cdef int _stackcnt
+    cdef unsigned long long _stackcnt
 
     def __init__(self):
         self._global = []
-        self._thread_context_lock = PyThread_allocate_lock()
         self._thread_context = thread_local()
-        self._greenlet_context_lock = GreenletRLock()
         self._greenlet_context = greenlet_local()
         self._context_stack = ContextVar('stack')
         self._cache = {}
         self._stackcnt = 0
 
-    cdef _stackop(self):
+    cdef unsigned long long _stackop(self):
         self._stackcnt += 1
         return self._stackcnt
 
     cpdef iter_context_objects(self):
         use_gevent = is_gevent_enabled()
-        use_context = is_context_enabled()
+        # a single lookup tells both if the context stack is in use and
+        # what its ident is.
+        tid = context_ident.get(None)
+        use_context = tid is not None
 
-        if use_context:
-            tid = context_get_ident()
-        elif use_gevent:
-            tid = greenlet_get_ident()
-        else:
-            tid = thread_get_ident()
+        if not use_context:
+            if use_gevent:
+                tid = greenlet_get_ident()
+            else:
+                tid = thread_get_ident()
 
         objects = self._cache.get(tid)
         if objects is None:
-            if PyList_GET_SIZE(self._cache) > _MAX_CONTEXT_OBJECT_CACHE:
-                PyDict_Clear(self._cache)
-            objects = self._global[:]
-            objects.extend(getattr(self._thread_context, 'stack', ()))
+            if PyDict_Size(self._cache) >= _MAX_CONTEXT_OBJECT_CACHE:
+                # evict the oldest entry instead of clearing the whole cache
+                # so that the other threads keep their cached objects.  The
+                # GIL is held throughout, so unlike the fallback no other
+                # thread can change the cache in between.
+                self._cache.pop(next(iter(self._cache)), None)
+            # the stacks are looked up in the __dict__ of the locals which
+            # avoids an AttributeError for threads that have no stack.
+            stacks = [self._global, self._thread_context.__dict__.get('stack', ())]
 
             if use_gevent:
-                objects.extend(getattr(self._greenlet_context, 'stack', ()))
+                stacks.append(self._greenlet_context.__dict__.get('stack', ()))
 
             if use_context:
-                objects.extend(self._context_stack.get([]))
+                stacks.append(self._context_stack.get([]))
 
-            PyList_Sort(objects)
-            objects = [(<_StackItem>x).val for x in objects]
+            stacks = [stack for stack in stacks if stack]
+            if len(stacks) > 1:
+                objects = [item for stack in stacks for item in stack]
+                PyList_Sort(objects)
+                objects = [(<_StackItem>x).val for x in objects]
+            else:
+                # every stack is kept in push order, so a single one only
+                # has to be reversed instead of sorted.
+                objects = [(<_StackItem>x).val
+                           for stack in stacks for x in reversed(stack)]
             PyDict_SetItem(self._cache, tid, objects)
         return iter(objects)
 
+    # the greenlet and thread stacks live in locals that only the owning
+    # greenlet or thread can see, and nothing below can switch greenlets,
+    # so they need no locks.  The cache pops are atomic dict operations.
     cpdef push_greenlet(self, obj):
-        self._greenlet_context_lock.acquire()
-        try:
-            self._cache.pop(greenlet_get_ident(), None)
-            item = _StackItem(self._stackop(), obj)
-            stack = getattr(self._greenlet_context, 'stack', None)
-            if stack is None:
-                self._greenlet_context.stack = [item]
-            else:
-                PyList_Append(stack, item)
-        finally:
-            self._greenlet_context_lock.release()
+        self._cache.pop(greenlet_get_ident(), None)
+        item = _StackItem(self._stackop(), obj)
+        stack = self._greenlet_context.__dict__.get('stack')
+        if stack is None:
+            self._greenlet_context.stack = [item]
+        else:
+            PyList_Append(stack, item)
 
     cpdef pop_greenlet(self):
-        self._greenlet_context_lock.acquire()
-        try:
-            self._cache.pop(greenlet_get_ident(), None)
-            stack = getattr(self._greenlet_context, 'stack', None)
-            assert stack, 'no objects on stack'
-            return (<_StackItem>stack.pop()).val
-        finally:
-            self._greenlet_context_lock.release()
+        self._cache.pop(greenlet_get_ident(), None)
+        stack = self._greenlet_context.__dict__.get('stack')
+        assert stack, 'no objects on stack'
+        return (<_StackItem>stack.pop()).val
 
     cpdef push_context(self, obj):
         self._cache.pop(context_get_ident(), None)
@@ -275,27 +275,19 @@ cdef class ContextStackManager:
         return (<_StackItem>stack.pop()).val
 
     cpdef push_thread(self, obj):
-        PyThread_acquire_lock(self._thread_context_lock, WAIT_LOCK)
-        try:
-            self._cache.pop(thread_get_ident(), None)
-            item = _StackItem(self._stackop(), obj)
-            stack = getattr(self._thread_context, 'stack', None)
-            if stack is None:
-                self._thread_context.stack = [item]
-            else:
-                PyList_Append(stack, item)
-        finally:
-            PyThread_release_lock(self._thread_context_lock)
+        self._cache.pop(thread_get_ident(), None)
+        item = _StackItem(self._stackop(), obj)
+        stack = self._thread_context.__dict__.get('stack')
+        if stack is None:
+            self._thread_context.stack = [item]
+        else:
+            PyList_Append(stack, item)
 
     cpdef pop_thread(self):
-        PyThread_acquire_lock(self._thread_context_lock, WAIT_LOCK)
-        try:
-            self._cache.pop(thread_get_ident(), None)
-            stack = getattr(self._thread_context, 'stack', None)
-            assert stack, 'no objects on stack'
-            return (<_StackItem>stack.pop()).val
-        finally:
-            PyThread_release_lock(self._thread_context_lock)
+        self._cache.pop(thread_get_ident(), None)
+        stack = self._thread_context.__dict__.get('stack')
+        assert stack, 'no objects on stack'
+        return (<_StackItem>stack.pop()).val
 
     cpdef push_application(self, obj):
         self._global.append(_StackItem(self._stackop(), obj))
@@ -12,12 +12,10 @@ from itertools import count
 
 from logbook.concurrency import (
     ContextVar,
-    GreenletRLock,
-    ThreadLock,
     context_get_ident,
+    context_ident,
     greenlet_get_ident,
     greenlet_local,
-    is_context_enabled,
     is_gevent_enabled,
     thread_get_ident,
     thread_local,
@@ -28,30 +26,39 @@ _missing = object()
 _MAX_CONTEXT_OBJECT_CACHE = 256
 
 
-def group_reflected_property(name, default, fallback=_missing):
-    """Returns a property for a given name that falls back to the
-    value of the group if set.  If there is no such group, the
-    provided default is used.
+class group_reflected_property:
+    """A property for a given name that falls back to the value of the
+    group if set.  If there is no such group, the provided default is used.
     """
 
-    def _get(self):
-        rv = getattr(self, "_" + name, _missing)
-        if rv is not _missing and rv != fallback:
-            return rv
-        if self.group is None:
-            return default
-        return getattr(self.group, name)
+    __slots__ = ("name", "_name", "default", "fallback")
+
+    def __init__(self, name, default, fallback=_missing):
+        self.name = name
+        self._name = "_" + name
+        self.default = default
+        self.fallback = fallback
 
-    def _set(self, value):
-        setattr(self, "_" + name, value)
+    def __get__(self, obj, type=None):
+        if obj is None:
+            return self
+        rv = getattr(obj, self._name, _missing)
+        if rv is not _missing and rv != self.fallback:
+            return rv
+        if obj.group is None:
+            return self.default
+        return getattr(obj.group, self.name)
 
-    def _del(self):
-        delattr(self, "_" + name)
+    def __set__(self, obj, value):
+        setattr(obj, self._name, value)
 
-    return property(_get, _set, _del)
+    def __delete__(self, obj):
+        delattr(obj, self._name)
 
 
 class _StackBound:
+    __slots__ = ("__obj", "__push", "__pop")
+
     def __init__(self, obj, push, pop):
         self.__obj = obj
         self.__push = push
@@ -70,6 +77,8 @@ class StackedObject:
     operations.
     """
 
+    __slots__ = ()
+
     def push_greenlet(self):
         """Pushes the stacked object to the greenlet stack."""
         raise NotImplementedError()
@@ -146,11 +155,18 @@ class ContextStackManager:
     objects.
     """
 
+    __slots__ = (
+        "_global",
+        "_thread_context",
+        "_greenlet_context",
+        "_context_stack",
+        "_cache",
+        "_stackop",
+    )
+
     def __init__(self):
         self._global = []
-        self._thread_context_lock = ThreadLock()
         self._thread_context = thread_local()
-        self._greenlet_context_lock = GreenletRLock()
         self._greenlet_context = greenlet_local()
         self._context_stack = ContextVar("stack")
         self._cache = {}
@@ -161,57 +177,70 @@ class ContextStackManager:
         application and context cache.
         """
         use_gevent = is_gevent_enabled()
-        use_context = is_context_enabled()
+        # a single lookup tells both if the context stack is in use and
+        # what its ident is.
+        tid = context_ident.get(None)
+        use_context = tid is not None
 
-        if use_context:
-            tid = context_get_ident()
-        elif use_gevent:
-            tid = greenlet_get_ident()
-        else:
-            tid = thread_get_ident()
+        if not use_context:
+            if use_gevent:
+                tid = greenlet_get_ident()
+            else:
+                tid = thread_get_ident()
 
         objects = self._cache.get(tid)
         if objects is None:
-            if len(self._cache) > _MAX_CONTEXT_OBJECT_CACHE:
-                self._cache.clear()
-            objects = self._global[:]
-            objects.extend(getattr(self._thread_context, "stack", ()))
+            if len(self._cache) >= _MAX_CONTEXT_OBJECT_CACHE:
+                # evict the oldest entry instead of clearing the whole cache
+                # so that the other threads keep their cached objects.  The
+                # cache may be cleared or changed by other threads meanwhile.
+                try:
+                    key = next(iter(self._cache), None)
+                except RuntimeError:
+                    key = None
+                if key is not None:
+                    self._cache.pop(key, None)
+            # the stacks are looked up in the __dict__ of the locals which
+            # avoids an AttributeError for threads that have no stack.
+            stacks = [self._global, self._thread_context.__dict__.get("stack", ())]
 
             if use_gevent:
-                objects.extend(getattr(self._greenlet_context, "stack", ()))
+                stacks.append(self._greenlet_context.__dict__.get("stack", ()))
 
             if use_context:
-                objects.extend(self._context_stack.get([]))
+                stacks.append(self._context_stack.get([]))
 
-            objects.sort(reverse=True)
-            objects = [x[1] for x in objects]
+            stacks = [stack for stack in stacks if stack]
+            if len(stacks) > 1:
+                objects = [item for stack in stacks for item in stack]
+                objects.sort(reverse=True)
+                objects = [x[1] for x in objects]
+            else:
+                # every stack is kept in push order, so a single one only
+                # has to be reversed instead of sorted.
+                objects = [x[1] for stack in stacks for x in reversed(stack)]
             self._cache[tid] = objects
         return iter(objects)
 
+    # the greenlet and thread stacks live in locals that only the owning
+    # greenlet or thread can see, and nothing below can switch greenlets,
+    # so they need no locks.  The cache pops are atomic dict operations.
     def push_greenlet(self, obj):
-        self._greenlet_context_lock.acquire()
-        try:
-            # remote chance to conflict with thread ids
-            self._cache.pop(greenlet_get_ident(), None)
-            item = (self._stackop(), obj)
-            stack = getattr(self._greenlet_context, "stack", None)
-            if stack is None:
-                self._greenlet_context.stack = [item]
-            else:
-                stack.append(item)
-        finally:
-            self._greenlet_context_lock.release()
+        # remote chance to conflict with thread ids
+        self._cache.pop(greenlet_get_ident(), None)
+        item = (self._stackop(), obj)
+        stack = self._greenlet_context.__dict__.get("stack")
+        if stack is None:
+            self._greenlet_context.stack = [item]
+        else:
+            stack.append(item)
 
     def pop_greenlet(self):
-        self._greenlet_context_lock.acquire()
-        try:
-            # remote chance to conflict with thread ids
-            self._cache.pop(greenlet_get_ident(), None)
-            stack = getattr(self._greenlet_context, "stack", None)
-            assert stack, "no objects on stack"
-            return stack.pop()[1]
-        finally:
-            self._greenlet_context_lock.release()
+        # remote chance to conflict with thread ids
+        self._cache.pop(greenlet_get_ident(), None)
+        stack = self._greenlet_context.__dict__.get("stack")
+        assert stack, "no objects on stack"
+        return stack.pop()[1]
 
     def push_context(self, obj):
         self._cache.pop(context_get_ident(), None)
@@ -230,27 +259,19 @@ class ContextStackManager:
         return stack.pop()[1]
 
     def push_thread(self, obj):
-        self._thread_context_lock.acquire()
-        try:
-            self._cache.pop(thread_get_ident(), None)
-            item = (self._stackop(), obj)
-            stack = getattr(self._thread_context, "stack", None)
-            if stack is None:
-                self._thread_context.stack = [item]
-            else:
-                stack.append(item)
-        finally:
-            self._thread_context_lock.release()
+        self._cache.pop(thread_get_ident(), None)
+        item = (self._stackop(), obj)
+        stack = self._thread_context.__dict__.get("stack")
+        if stack is None:
+            self._thread_context.stack = [item]
+        else:
+            stack.append(item)
 
     def pop_thread(self):
-        self._thread_context_lock.acquire()
-        try:
-            self._cache.pop(thread_get_ident(), None)
-            stack = getattr(self._thread_context, "stack", None)
-            assert stack, "no objects on stack"
-            return stack.pop()[1]
-        finally:
-            self._thread_context_lock.release()
+        self._cache.pop(thread_get_ident(), None)
+        stack = self._thread_context.__dict__.get("stack")
+        assert stack, "no objects on stack"
+        return stack.pop()[1]
 
     def push_application(self, obj):
         self._global.append((self._stackop(), obj))
@@ -8,9 +8,9 @@
     :license: BSD, see LICENSE for more details.
 """
 
-esc = "\x1b["
+from types import MappingProxyType
 
-codes = {"": "", "reset": esc + "39;49;00m"}
+esc = "\x1b["
 
 dark_colors = [
     "black",
@@ -32,29 +32,43 @@ light_colors = [
     "turquoise",
     "white",
 ]
+aliases = {
+    "darkteal": "turquoise",
+    "darkyellow": "brown",
+    "fuscia": "fuchsia",
+}
+
+_codes = {
+    "": "",
+    "reset": esc + "39;49;00m",
+    **{name: esc + "%im" % x for x, name in enumerate(dark_colors, 30)},
+    **{name: esc + "%i;01m" % x for x, name in enumerate(light_colors, 30)},
+}
+_codes.update({alias: _codes[name] for alias, name in aliases.items()})
+# the same codes for colorizing bytes
+_codes_bytes = {k: v.encode("ascii") for k, v in _codes.items()}
+
+#: read-only views of the color codes.  The functions below use the
+#: underlying dicts directly, which are slightly faster to index.
+codes = MappingProxyType(_codes)
+codes_bytes = MappingProxyType(_codes_bytes)
 
-x = 30
-for d, l in zip(dark_colors, light_colors):
-    codes[d] = esc + "%im" % x
-    codes[l] = esc + "%i;01m" % x
-    x += 1
+_reset = _codes["reset"]
+_reset_bytes = _codes_bytes["reset"]
 
-del d, l, x
 
-codes["darkteal"] = codes["turquoise"]
-codes["darkyellow"] = codes["brown"]
-codes["fuscia"] = codes["fuchsia"]
+def colorize_str(color_key, text):
+    """Returns an ANSI formatted string with the given color."""
+    return _codes[color_key] + text + _reset
 
 
-def _str_to_type(obj, strtype):
-    """Helper for ansiformat and colorize"""
-    if isinstance(obj, type(strtype)):
-        return obj
-    return obj.encode("ascii")
+def colorize_bytes(color_key, text):
+    """Returns an ANSI formatted bytestring with the given color."""
+    return _codes_bytes[color_key] + text + _reset_bytes
 
 
 def colorize(color_key, text):
     """Returns an ANSI formatted text with the given color."""
-    return (
-        _str_to_type(codes[color_key], text) + text + _str_to_type(codes["reset"], text)
-    )
+    if isinstance(text, bytes):
+        return colorize_bytes(color_key, text)
+    return colorize_str(color_key, text)
@@ -47,6 +47,19 @@ except ImportError:
 
 _datetime_factory = datetime_utcnow
 
+#: the PID of the current process.  It only changes in forked children,
+#: so it is refreshed there instead of being looked up for every record.
+_pid = os.getpid()
+
+
+def _refresh_pid():
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
 
 def set_datetime_format(datetime_format):
     """
@@ -142,6 +155,21 @@ _level_names = {
 _reverse_level_names = {v: k for (k, v) in _level_names.items()}
 _missing = object()
 
+#: normalized absolute source filenames, keyed by code object filename
+_abspath_cache = {}
+
+
+def _abspath(filename):
+    """Like :func:`os.path.abspath` but cached for absolute filenames.
+    Relative filenames depend on the working directory and are not cached.
+    """
+    rv = _abspath_cache.get(filename)
+    if rv is None:
+        rv = os.path.abspath(filename)
+        if os.path.isabs(filename):
+            _abspath_cache[filename] = rv
+    return rv
+
 
 def level_name_property():
     """Returns a property that reflects the level as name from
@@ -162,7 +190,8 @@ def level_name_property():
 
 def lookup_level(level):
     """Return the integer representation of a logging level."""
-    if isinstance(level, int):
+    # exact type check first; int subclasses (IntEnum etc.) take the slow path
+    if type(level) is int or isinstance(level, int):
         return level
     try:
         return _reverse_level_names[level]
@@ -181,6 +210,8 @@ def get_level_name(level):
 class _ExceptionCatcher:
     """Helper for exception caught blocks."""
 
+    __slots__ = ("logger", "args", "kwargs")
+
     def __init__(self, logger, args, kwargs):
         self.logger = logger
         self.args = args
@@ -382,6 +413,26 @@ class LogRecord:
     main information passed in is in msg and args
     """
 
+    # the attributes that are always set by the constructor live in slots,
+    # everything else (cached properties, custom attributes) still goes
+    # into the instance dictionary.
+    __slots__ = (
+        "channel",
+        "msg",
+        "args",
+        "kwargs",
+        "level",
+        "exc_info",
+        "extra",
+        "frame",
+        "frame_correction",
+        "process",
+        "_dispatcher",
+        "__dict__",
+        "__weakref__",
+    )
+    _slotted_attributes = frozenset(__slots__)
+
     _pullable_information = frozenset(
         (
             "func_name",
@@ -442,7 +493,7 @@ class LogRecord:
         #: the positional arguments for the format string.
         self.args = args or ()
         #: the keyword arguments for the format string.
-        self.kwargs = kwargs or {}
+        self.kwargs = kwargs if kwargs is not None else {}
         #: the level of the log record as integer.
         self.level = level
         #: optional exception information.  If set, this is a tuple in the
@@ -489,7 +540,7 @@ class LogRecord:
             return
         assert not self.late, "heavy init is no longer possible"
         self.heavy_initialized = True
-        self.process = os.getpid()
+        self.process = _pid
         self.time = _datetime_factory()
         if self.frame is None and Flags.get_flag("introspection", True):
             self.frame = sys._getframe(1)
@@ -509,13 +560,39 @@ class LogRecord:
         """
         if self.information_pulled:
             return
-        # due to how cached_property is implemented, the attribute access
-        # has the side effect of caching the attribute on the instance of
-        # the class.
-        for key in self._pullable_information:
-            getattr(self, key)
+        # cached properties are evaluated directly and stored on the
+        # instance which skips the descriptor protocol for every attribute.
+        # Anything else is pulled by regular attribute access.
+        d = self.__dict__
+        for key, func in self._get_pullers():
+            if key in d:
+                continue
+            if func is None:
+                getattr(self, key)
+            else:
+                d[key] = func(self)
         self.information_pulled = True
 
+    @classmethod
+    def _get_pullers(cls):
+        """Returns a tuple of ``(key, func)`` pairs for the pullable
+        information of this class, where `func` is the function behind the
+        cached property or `None` for other attributes.  This is computed
+        once per class.
+        """
+        pullers = cls.__dict__.get("_pullers")
+        if pullers is None:
+            pullers = []
+            for key in cls._pullable_information:
+                attr = getattr(cls, key, None)
+                if isinstance(attr, cached_property):
+                    pullers.append((key, attr.func))
+                else:
+                    pullers.append((key, None))
+            pullers = tuple(pullers)
+            cls._pullers = pullers
+        return pullers
+
     def close(self):
         """Closes the log record.  This will set the frame and calling
         frame to `None` and frame-related information will no longer be
@@ -537,6 +614,11 @@ class LogRecord:
         """
         self.pull_information()
         rv = {}
+        for key in LogRecord.__slots__:
+            if key[:1] != "_" and key not in self._noned_on_close:
+                value = getattr(self, key, _missing)
+                if value is not _missing:
+                    rv[key] = value
         for key, value in self.__dict__.items():
             if key[:1] != "_" and key not in self._noned_on_close:
                 rv[key] = value
@@ -559,7 +641,13 @@ class LogRecord:
         """Like the :meth:`from_dict` classmethod, but will update the
         instance in place.  Helpful for constructors.
         """
-        self.__dict__.update(d)
+        slotted = self._slotted_attributes
+        instance_dict = self.__dict__
+        for key, value in d.items():
+            if key in slotted:
+                setattr(self, key, value)
+            else:
+                instance_dict[key] = value
         for key in self._noned_on_close:
             setattr(self, key, None)
         self._information_pulled = True
@@ -674,7 +762,7 @@ class LogRecord:
             fn = cf.f_code.co_filename
             if fn[:1] == "<" and fn[-1:] == ">":
                 return fn
-            return os.path.abspath(fn)
+            return _abspath(fn)
 
     @cached_property
     def lineno(self):
@@ -833,7 +921,7 @@ class LoggerMixin:
         if "exc_info" not in kwargs:
             exc_info = sys.exc_info()
             assert exc_info[0] is not None, "no exception occurred"
-            kwargs.setdefault("exc_info", sys.exc_info())
+            kwargs["exc_info"] = exc_info
         return self.error(*args, **kwargs)
 
     def critical(self, *args, **kwargs):
@@ -850,7 +938,8 @@ class LoggerMixin:
         the use of reflection (e.g.: :func:`getattr`) for programmatic
         logging.
         """
-        level = lookup_level(level)
+        if type(level) is not int:
+            level = lookup_level(level)
         if level >= self.level:
             self._log(level, args, kwargs)
 
@@ -894,9 +983,14 @@ class LoggerMixin:
             raise AttributeError("The disabled property is read-only.")
 
     def _log(self, level, args, kwargs):
-        exc_info = kwargs.pop("exc_info", None)
-        extra = kwargs.pop("extra", None)
-        frame_correction = kwargs.pop("frame_correction", 0)
+        # most log calls come without keyword arguments at all
+        if kwargs:
+            exc_info = kwargs.pop("exc_info", None)
+            extra = kwargs.pop("extra", None)
+            frame_correction = kwargs.pop("frame_correction", 0)
+        else:
+            exc_info = extra = None
+            frame_correction = 0
         self.make_record_and_handle(
             level, args[0], args[1:], kwargs, exc_info, extra, frame_correction
         )
@@ -912,6 +1006,10 @@ class RecordDispatcher:
     suppress_dispatcher = False
 
     def __init__(self, name=None, level=NOTSET):
+        # names are interned as records carry them around and they are
+        # commonly used as lookup keys.  str subclasses cannot be interned.
+        if type(name) is str:
+            name = sys.intern(name)
         #: the name of the record dispatcher
         self.name = name
         #: list of handlers specific for this record dispatcher
@@ -941,6 +1039,18 @@ class RecordDispatcher:
         """Creates a record from some given arguments and heads it
         over to the handling system.
         """
+        # if no handler would accept a record of this level there is no
+        # point in creating one.  Custom dispatching logic might look at
+        # the record nonetheless so in that case it is always created.
+        if (
+            type(self).handle is RecordDispatcher.handle
+            and type(self).call_handlers is RecordDispatcher.call_handlers
+            and "handle" not in self.__dict__
+            and "call_handlers" not in self.__dict__
+            and not self._has_handler_for_level(level)
+        ):
+            return
+
         # The channel information can be useful for some use cases which is
         # why we keep it on there.  The log record however internally will
         # only store a weak reference to the channel, so it might disappear
@@ -977,6 +1087,25 @@ class RecordDispatcher:
             if not record.keep_open:
                 record.close()
 
+    def _has_handler_for_level(self, level):
+        """Checks if any of the handlers :meth:`call_handlers` would consider
+        could be interested in a record of the given level.  Handlers with a
+        custom :meth:`~logbook.Handler.should_handle` are always assumed to
+        be interested.
+        """
+        for handler in chain(
+            self.handlers, Handler.stack_manager.iter_context_objects()
+        ):
+            if (
+                type(handler).should_handle is Handler.should_handle
+                and "should_handle" not in handler.__dict__
+                and level < handler.level
+            ):
+                continue
+            # an unfiltered black hole discards the record right away
+            return handler.filter is not None or not handler.blackhole
+        return False
+
     def call_handlers(self, record):
         """Pass a record to all relevant handlers in the following
         order:
@@ -1001,8 +1130,15 @@ class RecordDispatcher:
         ):
             # skip records that this handler is not interested in based
             # on the record and handler level or in case this method was
-            # overridden on some custom logic.
-            if not handler.should_handle(record):
+            # overridden on some custom logic.  For handlers that use the
+            # default implementation the level check is done inline.
+            if (
+                type(handler).should_handle is Handler.should_handle
+                and "should_handle" not in handler.__dict__
+            ):
+                if record.level < handler.level:
+                    continue
+            elif not handler.should_handle(record):
                 continue
 
             # first case of blackhole (without filter).
@@ -170,17 +170,14 @@ context_ident = ContextVar("context_ident")
 
 
 def context_get_ident():
-    try:
-        return context_ident.get()
-    except LookupError:
+    ident = context_ident.get(None)
+    if ident is None:
         ident = "context-%s" % next(context_ident_counter)
         context_ident.set(ident)
-        return ident
+    return ident
 
 
 def is_context_enabled():
-    try:
-        context_ident.get()
-        return True
-    except LookupError:
-        return False
+    # passing a default avoids raising LookupError for the common case of
+    # not running in a context with logbook objects bound to it.
+    return context_ident.get(None) is not None
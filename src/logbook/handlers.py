@@ -317,9 +317,11 @@ class Handler(ContextObject, metaclass=_HandlerType):
             if behaviour == "raise":
                 raise exc_info[1]
             elif behaviour == "print":
-                traceback.print_exception(*(exc_info + (None, sys.stderr)))
+                # build the whole report first so that it ends up on stderr
+                # with a single write instead of one per traceback line.
                 sys.stderr.write(
-                    "Logged from file {}, line {}\n".format(
+                    "".join(traceback.format_exception(*exc_info))
+                    + "Logged from file {}, line {}\n".format(
                         record.filename, record.lineno
                     )
                 )
@@ -392,18 +394,7 @@ class StringFormatter:
         self._formatter = value
 
     def format_record(self, record, handler):
-        try:
-            return self._formatter.format(record=record, handler=handler)
-        except UnicodeEncodeError:
-            # self._formatter is a str, but some of the record items
-            # are unicode
-            fmt = self._formatter.decode("ascii", "replace")
-            return fmt.format(record=record, handler=handler)
-        except UnicodeDecodeError:
-            # self._formatter is unicode, but some of the record items
-            # are non-ascii str
-            fmt = self._formatter.encode("ascii", "replace")
-            return fmt.format(record=record, handler=handler)
+        return self._formatter.format(record=record, handler=handler)
 
     def format_exception(self, record):
         return record.formatted_exception
@@ -9,6 +9,7 @@
 """
 
 import errno
+import math
 import os
 import random
 import re
@@ -152,12 +153,32 @@ if sys.version_info >= (3, 12):
         """
         return datetime.now(timezone.utc).replace(tzinfo=None)
 
+    _utc_second = (None, None)
+
     def datetime_utcfromtimestamp(timestamp):
         """datetime.utcfromtimesetamp() but doesn't emit a deprecation warning.
 
+        The datetime for the whole second is cached, so converting the
+        timestamps of records created within the same second only has to
+        replace the microseconds.
+
         Will be fixed by https://github.com/getlogbook/logbook/issues/353
         """
-        return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+        global _utc_second
+        # split and round the same way datetime.fromtimestamp does
+        frac, second = math.modf(timestamp)
+        usec = round(frac * 1e6)
+        if usec >= 1000000:
+            usec -= 1000000
+            second += 1
+        elif usec < 0:
+            usec += 1000000
+            second -= 1
+        cached_second, rv = _utc_second
+        if cached_second != second:
+            rv = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None)
+            _utc_second = (second, rv)
+        return rv.replace(microsecond=usec)
 
 else:
     datetime_utcnow = datetime.utcnow
@@ -1,3 +1,5 @@
+import io
+
 import logbook
 
 from .utils import capturing_stderr_context, make_fake_mail_handler
@@ -136,3 +138,56 @@ def test_default_handlers(logger):
         logger.warn("Aha!")
         captured = stream.getvalue()
     assert "WARNING: testlogger: Aha!" in captured
+
+
+def test_custom_should_handle(activation_strategy, logger):
+    def channel_only(self, record):
+        return record.channel == "testlogger"
+
+    class ChannelHandler(logbook.TestHandler):
+        should_handle = channel_only
+
+    class SubChannelHandler(ChannelHandler):
+        pass
+
+    class OnlyChannelMixin:
+        should_handle = channel_only
+
+    class MixinChannelHandler(OnlyChannelMixin, logbook.TestHandler):
+        pass
+
+    instance_handler = logbook.TestHandler(level=logbook.ERROR)
+    instance_handler.should_handle = channel_only.__get__(instance_handler)
+
+    for handler in (
+        SubChannelHandler(level=logbook.ERROR),
+        MixinChannelHandler(level=logbook.ERROR),
+        instance_handler,
+    ):
+        with activation_strategy(handler):
+            logger.warn("A warning")
+            logbook.Logger("other").error("An error")
+
+        assert handler.has_warning("A warning")
+        assert not handler.has_errors
+
+
+def test_stream_handler_reentrant_emit(logger):
+    class ReentrantStream(io.StringIO):
+        def write(self, s):
+            if "outer" in s:
+                # e.g. a signal handler that logs while a record is written
+                logger.warn("inner")
+            return super().write(s)
+
+    stream = ReentrantStream()
+    with logbook.StreamHandler(stream, format_string="{record.message}"):
+        logger.warn("outer")
+    assert stream.getvalue().splitlines() == ["inner", "outer"]
+
+
+def test_should_handle_assigned_to_class(monkeypatch, logger):
+    monkeypatch.setattr(logbook.TestHandler, "should_handle", lambda self, record: True)
+    with logbook.TestHandler(level=logbook.ERROR) as handler:
+        logger.warn("A warning")
+    assert handler.has_warning("A warning")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
@@ -48,3 +48,16 @@ def test_datehelpers():
     assert v.hour == 11
     v = parse_iso8601("2000-01-01T12:00:00-01:00")
     assert v.hour == 13
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [0, 1700000000.5, 1700000000.9999999, 1700000001.25, -1.5, -0.0000001],
+)
+def test_datetime_utcfromtimestamp(timestamp):
+    from logbook.helpers import datetime_utcfromtimestamp
+
+    expected = datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+    assert datetime_utcfromtimestamp(timestamp) == expected
+    # second call for the same second is served from the cache
+    assert datetime_utcfromtimestamp(timestamp) == expected
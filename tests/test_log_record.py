@@ -1,5 +1,8 @@
+import os
 import sys
 
+import pytest
+
 import logbook
 
 from .utils import capturing_stderr_context
@@ -56,3 +59,84 @@ def test_frame_correction(active_handler, logger):
 def test_dispatcher(active_handler, logger):
     logger.warn("Logbook is too awesome for stdlib")
     assert active_handler.records[0].dispatcher == logger
+
+
+def test_pull_information_subclass():
+    class MyRecord(logbook.LogRecord):
+        @logbook.helpers.cached_property
+        def func_name(self):
+            return "overridden"
+
+        @property
+        def thread_name(self):
+            return "plain property"
+
+    record = MyRecord("channel", logbook.WARNING, "message", frame=sys._getframe())
+    assert "func_name" not in record.__dict__
+    assert "module" not in record.__dict__
+    record.pull_information()
+    pulled = dict(record.__dict__)
+    assert pulled["func_name"] == "overridden"
+    assert pulled["module"] == __name__
+    assert pulled["lineno"] is not None
+    # plain properties are evaluated but not stored
+    assert "thread_name" not in pulled
+    record.close()
+    for key in ("func_name", "module", "filename", "lineno", "message"):
+        assert record.__dict__[key] == pulled[key]
+    assert record.information_pulled
+
+
+def test_to_dict_roundtrip(active_handler, logger):
+    logger.warn("Hello {0}", "World", extra={"foo": "bar"})
+    record = active_handler.records[0]
+    exported = record.to_dict()
+    assert exported["channel"] == "testlogger"
+    assert exported["level"] == logbook.WARNING
+    assert exported["msg"] == "Hello {0}"
+    assert exported["args"] == ("World",)
+    assert exported["extra"] == {"foo": "bar"}
+    assert exported["message"] == "Hello World"
+
+    imported = logbook.LogRecord.from_dict(exported)
+    assert imported.channel == record.channel
+    assert imported.level == record.level
+    assert imported.args == record.args
+    assert imported.extra["foo"] == "bar"
+    assert imported.extra["missing"] == ""
+    assert imported.frame is None
+    assert imported.message == "Hello World"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_process_after_fork():
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            with logbook.handlers.TestHandler() as handler:
+                logbook.warn("from the child")
+            ok = handler.records[0].process == os.getpid()
+            os.write(write_fd, b"1" if ok else b"0")
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    try:
+        assert os.read(read_fd, 1) == b"1"
+    finally:
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+
+def test_filename(tmp_path, monkeypatch):
+    with logbook.handlers.TestHandler() as handler:
+        logbook.warn("first")
+        logbook.warn("second")
+    first, second = handler.records
+    assert first.filename == os.path.abspath(__file__)
+    assert second.filename == first.filename
+
+    monkeypatch.chdir(tmp_path)
+    expected = os.path.join(os.getcwd(), "relative.py")
+    assert logbook.base._abspath("relative.py") == expected
+    assert "relative.py" not in logbook.base._abspath_cache
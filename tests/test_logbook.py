@@ -1,3 +1,5 @@
+import enum
+
 import pytest
 
 import logbook
@@ -31,3 +33,12 @@ def test_level_lookup_failures():
         logbook.get_level_name(37)
     with pytest.raises(LookupError):
         logbook.lookup_level("FOO")
+
+
+def test_level_lookup():
+    class Level(enum.IntEnum):
+        WARNING = logbook.WARNING
+
+    assert logbook.lookup_level(logbook.INFO) == logbook.INFO
+    assert logbook.lookup_level("INFO") == logbook.INFO
+    assert logbook.lookup_level(Level.WARNING) is Level.WARNING
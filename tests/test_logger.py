@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 import logbook
@@ -43,3 +45,50 @@ def test_disabled_property():
 
     with pytest.raises(AttributeError):
         logger.disable()
+
+
+def test_no_record_without_interested_handler(logger, monkeypatch):
+    records = []
+
+    class RecordingMixin:
+        def handle(self, record):
+            records.append(record.level)
+
+    class RecordingLogger(logbook.Logger):
+        handle = RecordingMixin.handle
+
+    class MixinLogger(RecordingMixin, logbook.Logger):
+        pass
+
+    def fail(*args, **kwargs):
+        raise AssertionError("record should not be created")
+
+    handler = logbook.TestHandler(level=logbook.ERROR)
+    with logbook.NullHandler().applicationbound(), handler.applicationbound():
+        with monkeypatch.context() as m:
+            m.setattr(logbook.base, "LogRecord", fail)
+            logger.warn("A warning")
+        logger.error("An error")
+        RecordingLogger().warn("Another warning")
+        MixinLogger().warn("Yet another warning")
+        instance_logger = logbook.Logger()
+        instance_logger.handle = RecordingMixin.handle.__get__(instance_logger)
+        instance_logger.warn("An instance warning")
+        with monkeypatch.context() as m:
+            m.setattr(logbook.Logger, "handle", RecordingMixin.handle)
+            logbook.Logger().warn("A patched warning")
+
+    assert not handler.has_warnings
+    assert handler.has_error("An error")
+    assert records == [logbook.WARNING] * 4
+
+
+def test_name_is_interned():
+    name = ".".join(["my", "dynamic", "logger"])
+    assert logbook.Logger(name).name is sys.intern("my.dynamic.logger")
+    assert logbook.Logger().name is None
+
+    class MyStr(str):
+        pass
+
+    assert type(logbook.Logger(MyStr("abc")).name) is MyStr
@@ -62,6 +62,14 @@ def test_colorizing_support(logger):
         assert lines == ["An error", "A warning", "A debug message"]
 
 
+def test_colorize():
+    from logbook._termcolors import colorize
+
+    assert colorize("red", "text") == "\x1b[31;01mtext\x1b[39;49;00m"
+    assert colorize("red", b"text") == b"\x1b[31;01mtext\x1b[39;49;00m"
+    assert colorize("", "text") == "text\x1b[39;49;00m"
+
+
 def test_tagged(default_handler):
     from logbook.more import TaggingHandler, TaggingLogger
 
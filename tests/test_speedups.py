@@ -30,3 +30,36 @@ def test_group_reflected_property(speedups_module):
     assert a.foo == "set"
     del a.foo
     assert a.foo == "group"
+
+
+def test_context_stack_manager_order(speedups_module):
+    manager = speedups_module.ContextStackManager()
+    assert list(manager.iter_context_objects()) == []
+    manager.push_application("a")
+    manager.push_application("b")
+    assert list(manager.iter_context_objects()) == ["b", "a"]
+    manager.push_thread("c")
+    manager.push_application("d")
+    assert list(manager.iter_context_objects()) == ["d", "c", "b", "a"]
+    assert manager.pop_application() == "d"
+    assert manager.pop_thread() == "c"
+    assert list(manager.iter_context_objects()) == ["b", "a"]
+
+
+def test_context_stack_manager_cache_bound(speedups_module, monkeypatch):
+    import logbook.concurrency
+
+    # the cache is keyed by the thread ident only without gevent
+    monkeypatch.setattr(logbook.concurrency, "use_gevent", False)
+    manager = speedups_module.ContextStackManager()
+    manager.push_application("a")
+    idents = iter(range(300))
+    monkeypatch.setattr(speedups_module, "thread_get_ident", lambda: next(idents))
+    for _ in range(300):
+        assert list(manager.iter_context_objects()) == ["a"]
+
+    # the cache of the Cython implementation is not accessible
+    if speedups_module.__name__ == "logbook._fallback":
+        max_size = speedups_module._MAX_CONTEXT_OBJECT_CACHE
+        assert len(manager._cache) == max_size
+        assert list(manager._cache) == list(range(300 - max_size, 300))
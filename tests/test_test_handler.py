@@ -52,3 +52,26 @@ def test_test_handler_cache(active_handler, logger):
     logger.warn("Second line invalidates cache")
     assert len(active_handler.formatted_records) == 2
     assert cache is not active_handler.formatted_records
+
+
+def test_test_handler_level_index(active_handler, logger):
+    logger.warn("First line")
+    logger.error("Second line")
+    assert active_handler.has_warning("First line")
+    assert not active_handler.has_error("First line")
+    logger.warn("Third line")
+    assert active_handler.has_warning("Third line")
+    del active_handler.records[:]
+    assert not active_handler.has_warning("First line")
+    logger.error("Fourth line")
+    assert active_handler.has_error("Fourth line")
+    assert not active_handler.has_error("Second line")
+    # refill the cleared list up to its previous length
+    del active_handler.records[:]
+    logger.warn("A")
+    assert active_handler.has_warning("A")
+    del active_handler.records[:]
+    logger.warn("B")
+    logger.warn("C")
+    assert not active_handler.has_warning("A")
+    assert active_handler.has_warning("C")
@@ -96,6 +96,12 @@ def test_no_deprecations(capture):
 
     with suppressed_deprecations():
         assert func(1, 2) == 3
+
+    @suppressed_deprecations()
+    def call_func():
+        return func(1, 2)
+
+    assert call_func() == 3
     assert not capture.records
 
 